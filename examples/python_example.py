@@ -4,7 +4,9 @@ Example usage of onlyfunding.fun Python SDK
 Demonstrates basic functionality for working with funding rates API
 """
 
-from onlyfunding_sdk import onlyfundingClient
+import asyncio
+
+from onlyfunding_sdk import onlyfundingClient, onlyfundingAsyncClient
 
 def main():
     client = onlyfundingClient()
@@ -25,17 +27,36 @@ def main():
         print("✗ Rate not found\n")
     
     # Find arbitrage opportunities
-    print("Finding arbitrage opportunities for BTC (min spread: 0.01%)...")
-    opportunities = client.find_arbitrage_opportunities('BTC', min_spread=0.01)
+    print("Finding top 5 arbitrage opportunities for BTC (min spread: 0.01%)...")
+    opportunities = client.find_arbitrage_opportunities('BTC', min_spread=0.01, top_k=5)
     print(f"✓ Found {len(opportunities)} opportunities\n")
     
     if opportunities:
-        print("Top 5 opportunities:")
-        for i, opp in enumerate(opportunities[:5], 1):
-            print(f"\n{i}. {opp['symbol']} - Spread: {opp['spread']:.4f}%")
-            print(f"   Long:  {opp['long_exchange']} ({opp['rate1']:.4f}%)")
-            print(f"   Short: {opp['short_exchange']} ({opp['rate2']:.4f}%)")
+        print(f"Top {len(opportunities)} opportunities:")
+        for i, opp in enumerate(opportunities, 1):
+            print(f"\n{i}. {opp.symbol} - Spread: {opp.spread:.4f}%")
+            print(f"   Long:  {opp.long_exchange} ({opp.rate_long:.4f}%)")
+            print(f"   Short: {opp.short_exchange} ({opp.rate_short:.4f}%)")
+
+async def main_async():
+    print("\n=== Async client ===\n")
+    
+    async with onlyfundingAsyncClient() as client:
+        # Concurrent queries share a single fetch of the funding rates
+        symbols = ['BTC', 'ETH', 'SOL']
+        results = await asyncio.gather(*(
+            client.find_arbitrage_opportunities(symbol, min_spread=0.01, top_k=1)
+            for symbol in symbols
+        ))
+        
+        for symbol, opportunities in zip(symbols, results):
+            if opportunities:
+                best = opportunities[0]
+                print(f"{symbol}: {best.spread:.4f}% (long {best.long_exchange}, short {best.short_exchange})")
+            else:
+                print(f"{symbol}: no opportunities")
 
 if __name__ == "__main__":
     main()
+    asyncio.run(main_async())
 
@@ -2,8 +2,8 @@
 onlyfunding.fun SDK for Python
 """
 
-from .onlyfunding_sdk import onlyfundingClient, onlyfundingError, FundingRatesData, ExchangeInfo
+from .onlyfunding_sdk import onlyfundingClient, onlyfundingAsyncClient, onlyfundingError, FundingRatesData, ExchangeInfo, ArbitrageOpportunity, MISSING_RATE
 
 __version__ = "1.0.0"
-__all__ = ["onlyfundingClient", "onlyfundingError", "FundingRatesData", "ExchangeInfo"]
+__all__ = ["onlyfundingClient", "onlyfundingAsyncClient", "onlyfundingError", "FundingRatesData", "ExchangeInfo", "ArbitrageOpportunity", "MISSING_RATE"]
 
@@ -3,11 +3,156 @@ onlyfunding.fun SDK for Python
 Official Python client for onlyfunding.fun funding rates API
 """
 
-import requests
+import asyncio
+import functools
+import sys
+import textwrap
+import threading
+import time
+import httpx
+import numpy as np
+import orjson
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    from numba import njit
+except ImportError:  # numba is an optional speedup
+    njit = None
+
+try:
+    import ijson
+except ImportError:  # ijson enables streamed single-rate lookups
+    ijson = None
+
+
+def _intern(name: Any) -> Any:
+    """sys.intern that also accepts str subclasses (e.g. str enums) and passes non-strings through"""
+    if type(name) is str:
+        return sys.intern(name)
+    if isinstance(name, str):
+        return sys.intern(str.__str__(name))
+    return name
+
+
+def _enum_pairs_loop(
+    rates: np.ndarray,
+    min_spread: float,
+    out_i: np.ndarray,
+    out_j: np.ndarray,
+    out_spread: np.ndarray
+) -> int:
+    """
+    Write exchange pairs (i, j, spread) with i < j whose spread passes min_spread
+    
+    Outputs must hold at least n * (n - 1) // 2 entries; returns the count written.
+    """
+    n = rates.shape[0]
+    k = 0
+    for i in range(n):
+        a = rates[i]
+        for j in range(i + 1, n):
+            spread = abs(a - rates[j]) / 10000.0
+            if spread >= min_spread:
+                out_i[k] = i
+                out_j[k] = j
+                out_spread[k] = spread
+                k += 1
+    return k
+
+
+def _enum_pairs_numpy(
+    rates: np.ndarray,
+    min_spread: float,
+    out_i: np.ndarray,
+    out_j: np.ndarray,
+    out_spread: np.ndarray
+) -> int:
+    """Vectorized equivalent of _enum_pairs_loop, used when numba is unavailable"""
+    iu_i, iu_j = np.triu_indices(rates.shape[0], k=1)
+    spreads = np.abs(rates[iu_i] - rates[iu_j]) / 10000.0
+    keep = np.nonzero(spreads >= min_spread)[0]
+    k = len(keep)
+    out_i[:k] = iu_i[keep]
+    out_j[:k] = iu_j[keep]
+    out_spread[:k] = spreads[keep]
+    return k
+
+
+if njit is not None:
+    _enum_pairs = njit(cache=True)(_enum_pairs_loop)
+else:
+    _enum_pairs = _enum_pairs_numpy
+
+
+# Exchange counts up to this get a fully unrolled, shape-specialized pair kernel.
+# Compile time grows with the pair count, so larger sets use the generic kernel.
+_SPECIALIZE_MAX_EXCHANGES = 8
+
+_PAIR_BLOCK = """
+if r{i} != MISSING_RATE and r{j} != MISSING_RATE:
+    spread = abs(r{i} - r{j}) / 10000.0
+    if spread >= min_spread:
+        out_i[k] = {i}
+        out_j[k] = {j}
+        out_spread[k] = spread
+        k += 1
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _specialized_pair_kernel(n_exchanges: int):
+    """
+    Pair kernel unrolled for exactly n_exchanges rates, or None if unavailable
+    
+    Unlike the generic kernel it takes a full matrix column and skips
+    MISSING_RATE cells itself. Compiled with an explicit signature; the code is
+    exec-generated, so numba's on-disk cache cannot be used.
+    """
+    if njit is None or not 2 <= n_exchanges <= _SPECIALIZE_MAX_EXCHANGES:
+        return None
+    
+    loads = "".join(f"r{i} = rates[{i}]\n" for i in range(n_exchanges))
+    blocks = "".join(
+        _PAIR_BLOCK.format(i=i, j=j)
+        for i in range(n_exchanges)
+        for j in range(i + 1, n_exchanges)
+    )
+    source = (
+        f"def _pairs_{n_exchanges}(rates, min_spread, out_i, out_j, out_spread):\n"
+        + textwrap.indent("k = 0\n" + loads + blocks + "return k\n", "    ")
+    )
+    
+    namespace: Dict[str, Any] = {'MISSING_RATE': MISSING_RATE}
+    try:
+        exec(compile(source, f"<onlyfunding pairs {n_exchanges}>", "exec"), namespace)
+        return njit("int64(int64[:], float64, int32[:], int32[:], float64[:])")(
+            namespace[f"_pairs_{n_exchanges}"]
+        )
+    except Exception:  # any numba failure just disables specialization
+        return None
+
+
+def _descending_order(values: np.ndarray, top_k: Optional[int] = None) -> np.ndarray:
+    """
+    Indices of values sorted descending, ties kept in index order
+    
+    With top_k, only the k largest are selected (via a partition) before sorting;
+    the result equals the first k entries of the full ordering.
+    """
+    n = values.shape[0]
+    if top_k is None or top_k >= n:
+        return np.argsort(-values, kind='stable')
+    if top_k <= 0:
+        return np.empty(0, dtype=np.intp)
+    
+    kth = np.partition(values, n - top_k)[n - top_k]
+    above = np.nonzero(values > kth)[0]
+    ties = np.nonzero(values == kth)[0][:top_k - len(above)]
+    selected = np.concatenate((above, ties))
+    return selected[np.argsort(-values[selected], kind='stable')]
+
 
 @dataclass
 class ExchangeInfo:
@@ -17,14 +162,182 @@ class ExchangeInfo:
 
 
 @dataclass
+class ArbitrageOpportunity:
+    """Funding rate spread between two exchanges for one symbol (rates in percent)"""
+    __slots__ = ('symbol', 'long_exchange', 'short_exchange', 'rate_long', 'rate_short', 'spread')
+    
+    symbol: str
+    long_exchange: str
+    short_exchange: str
+    rate_long: float
+    rate_short: float
+    spread: float
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Legacy dict form; exchange1/rate1 is the long side, exchange2/rate2 the short side"""
+        return {
+            'symbol': self.symbol,
+            'exchange1': self.long_exchange,
+            'rate1': self.rate_long,
+            'exchange2': self.short_exchange,
+            'rate2': self.rate_short,
+            'spread': self.spread,
+            'long_exchange': self.long_exchange,
+            'short_exchange': self.short_exchange
+        }
+
+
+# Marks exchange/symbol cells of rates_matrix that have no quoted rate
+MISSING_RATE = int(np.iinfo(np.int64).min)
+_INT64_MIN = MISSING_RATE
+_INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+@dataclass(init=False)
 class FundingRatesData:
-    """Funding rates API response"""
+    """
+    Funding rates API response
+    
+    Rates are stored in ``rates_matrix`` with shape (exchanges, symbols), indexed
+    through ``exchange_index`` and ``symbol_index``. Cells without a rate, or whose
+    rate is null, non-integer or outside int64, hold ``MISSING_RATE``. The nested
+    ``funding_rates`` dict is still accepted at construction and is rebuilt from
+    the matrix on first access.
+    """
     symbols: List[str]
     exchanges: Dict[str, Any]
-    funding_rates: Dict[str, Dict[str, int]]
     oi_rankings: Dict[str, str]
     default_oi_rank: str
     timestamp: str
+    rates_matrix: np.ndarray
+    exchange_index: Dict[str, int]
+    symbol_index: Dict[str, int]
+    
+    def __init__(
+        self,
+        symbols: List[str],
+        exchanges: Dict[str, Any],
+        funding_rates: Optional[Dict[str, Dict[str, int]]] = None,
+        oi_rankings: Optional[Dict[str, str]] = None,
+        default_oi_rank: str = '500+',
+        timestamp: str = '',
+        *,
+        rates_matrix: Optional[np.ndarray] = None,
+        exchange_index: Optional[Dict[str, int]] = None,
+        symbol_index: Optional[Dict[str, int]] = None
+    ):
+        """
+        Args:
+            symbols: Symbol names listed by the API
+            exchanges: Raw ``exchanges`` object from the API
+            funding_rates: Nested exchange -> symbol -> rate mapping; the matrix
+                is built from it unless ``rates_matrix`` and the indexes are given
+            oi_rankings: Open interest rank per symbol
+            default_oi_rank: Rank used for symbols missing from ``oi_rankings``
+            timestamp: API timestamp
+            rates_matrix: Prebuilt (exchanges, symbols) int64 rate matrix
+            exchange_index: Exchange name -> matrix row
+            symbol_index: Symbol name -> matrix column
+        """
+        if rates_matrix is None or exchange_index is None or symbol_index is None:
+            symbols, rates_matrix, exchange_index, symbol_index = self._build_matrix(
+                funding_rates or {}, symbols
+            )
+        
+        self.symbols = symbols
+        self.exchanges = exchanges
+        self.oi_rankings = oi_rankings if oi_rankings is not None else {}
+        self.default_oi_rank = default_oi_rank
+        self.timestamp = timestamp
+        self.rates_matrix = rates_matrix
+        self.exchange_index = exchange_index
+        self.symbol_index = symbol_index
+        # Lazily rebuilt nested dict; a plain attribute so it is not a dataclass field
+        self._funding_rates: Optional[Dict[str, Dict[str, int]]] = None
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FundingRatesData):
+            return NotImplemented
+        return (
+            self.symbols == other.symbols
+            and self.exchanges == other.exchanges
+            and self.oi_rankings == other.oi_rankings
+            and self.default_oi_rank == other.default_oi_rank
+            and self.timestamp == other.timestamp
+            and self.exchange_index == other.exchange_index
+            and self.symbol_index == other.symbol_index
+            and np.array_equal(self.rates_matrix, other.rates_matrix)
+        )
+    
+    @classmethod
+    def from_funding_rates(
+        cls,
+        funding_rates: Dict[str, Dict[str, int]],
+        **kwargs: Any
+    ) -> "FundingRatesData":
+        """
+        Build from the API's nested exchange -> symbol -> rate mapping
+        
+        Args:
+            funding_rates: Raw ``funding_rates`` object from the API
+            **kwargs: Remaining ``FundingRatesData`` fields
+        """
+        return cls(funding_rates=funding_rates, **kwargs)
+    
+    @staticmethod
+    def _build_matrix(funding_rates: Dict[str, Dict[str, int]], symbols: List[str]):
+        """Interned symbols, rate matrix and its exchange/symbol indexes"""
+        # Names repeat across the payload; intern them so lookups compare by identity
+        symbols = [_intern(symbol) for symbol in symbols]
+        symbol_index: Dict[str, int] = {}
+        for symbol in symbols:
+            symbol_index.setdefault(symbol, len(symbol_index))
+        # Null or malformed exchange entries are treated as quoting nothing
+        rows = [
+            exchange_rates if isinstance(exchange_rates, dict) else {}
+            for exchange_rates in funding_rates.values()
+        ]
+        for exchange_rates in rows:
+            for symbol in exchange_rates:
+                if symbol not in symbol_index:
+                    symbol_index[_intern(symbol)] = len(symbol_index)
+        exchange_index = {_intern(exchange): i for i, exchange in enumerate(funding_rates)}
+        
+        matrix = np.full((len(exchange_index), len(symbol_index)), MISSING_RATE, dtype=np.int64)
+        for row, exchange_rates in enumerate(rows):
+            if not exchange_rates:
+                continue
+            values = exchange_rates.values()
+            if all(type(rate) is int and _INT64_MIN < rate <= _INT64_MAX for rate in values):
+                cols = np.fromiter(
+                    (symbol_index[symbol] for symbol in exchange_rates),
+                    dtype=np.intp,
+                    count=len(exchange_rates)
+                )
+                matrix[row, cols] = np.fromiter(values, dtype=np.int64, count=len(exchange_rates))
+                continue
+            
+            # Keep only integer cells that fit; null, float or string rates stay missing
+            for symbol, rate in exchange_rates.items():
+                if type(rate) is int and _INT64_MIN < rate <= _INT64_MAX:
+                    matrix[row, symbol_index[symbol]] = rate
+        
+        return symbols, matrix, exchange_index, symbol_index
+    
+    @property
+    def funding_rates(self) -> Dict[str, Dict[str, int]]:
+        """Nested exchange -> symbol -> rate mapping, as returned by the API"""
+        if self._funding_rates is None:
+            symbols = list(self.symbol_index)
+            self._funding_rates = {
+                exchange: {
+                    symbol: rate
+                    for symbol, rate in zip(symbols, self.rates_matrix[row].tolist())
+                    if rate != MISSING_RATE
+                }
+                for exchange, row in self.exchange_index.items()
+            }
+        return self._funding_rates
 
 
 class onlyfundingError(Exception):
@@ -32,63 +345,282 @@ class onlyfundingError(Exception):
     pass
 
 
-class onlyfundingClient:
-    """Client for accessing onlyfunding.fun funding rates API"""
+class _ClientBase:
+    """Cache and analysis logic shared by the sync and async clients"""
     
     BASE_URL = "https://api.onlyfunding.fun"
+    HEADERS = {
+        'Accept': 'application/json',
+        'Accept-Encoding': 'br, gzip, deflate',
+        'User-Agent': 'onlyfunding-Python-SDK/1.0.0'
+    }
+    
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: int = 30,
+        cache_ttl: float = 30.0,
+        specialize_kernels: bool = False
+    ):
+        self.base_url = base_url or self.BASE_URL
+        self.timeout = timeout
+        self._cache: Optional[FundingRatesData] = None
+        self._cache_ts: float = 0.0
+        self._cache_ttl: float = cache_ttl
+        self._specialize_kernels = specialize_kernels
+        # Bumped on every refresh; keys the get_rate memo so stale entries never hit
+        self._cache_generation: int = 0
+        self._get_rate_cached = functools.lru_cache(maxsize=4096)(self._get_rate_impl)
+        # Reused output arrays for the pair kernel, one set per thread
+        self._pair_local = threading.local()
+    
+    def _cache_is_fresh(self) -> bool:
+        return (
+            self._cache is not None
+            and time.monotonic() - self._cache_ts < self._cache_ttl
+        )
+    
+    def _store_cache(self, data: FundingRatesData) -> None:
+        self._cache = data
+        self._cache_ts = time.monotonic()
+        self._cache_generation += 1
+    
+    def _stale_or_raise(
+        self,
+        error: onlyfundingError,
+        force_refresh: bool
+    ) -> FundingRatesData:
+        """Serve the last good data after a failed refresh, unless fresh data was forced"""
+        if force_refresh or self._cache is None:
+            raise error
+        return self._cache
+    
+    def clear_cache(self) -> None:
+        """Drop cached funding rates so the next call hits the API"""
+        self._cache = None
+        self._cache_ts = 0.0
+    
+    @staticmethod
+    def _parse_funding_rates(content: bytes) -> FundingRatesData:
+        """
+        Decode a /funding response body
+        
+        Raises:
+            onlyfundingError: If the payload is not a valid API response
+        """
+        try:
+            data = orjson.loads(content)
+            
+            return FundingRatesData.from_funding_rates(
+                data.get('funding_rates', {}),
+                symbols=data.get('symbols', []),
+                exchanges=data.get('exchanges', {}),
+                oi_rankings=data.get('oi_rankings', {}),
+                default_oi_rank=data.get('default_oi_rank', '500+'),
+                timestamp=data.get('timestamp', '')
+            )
+        except (AttributeError, KeyError, OverflowError, TypeError, ValueError) as e:
+            raise onlyfundingError(f"Invalid API response: {str(e)}")
+    
+    def _get_rate_impl(self, generation: int, exchange: str, symbol: str) -> Optional[float]:
+        """Rate lookup against the cached payload of the given generation"""
+        return self._rate_from(self._cache, exchange, symbol)
+    
+    @staticmethod
+    def _rate_from(data: FundingRatesData, exchange: str, symbol: str) -> Optional[float]:
+        """Look up one rate as percentage, or None if not quoted"""
+        row = data.exchange_index.get(exchange)
+        col = data.symbol_index.get(symbol)
+        if row is None or col is None:
+            return None
+        
+        rate = int(data.rates_matrix[row, col])
+        if rate == MISSING_RATE:
+            return None
+        
+        return rate / 10000.0
+    
+    def _opportunities_from(
+        self,
+        data: FundingRatesData,
+        symbols: List[str],
+        min_spread: float,
+        top_k: Optional[int]
+    ) -> Dict[str, List[ArbitrageOpportunity]]:
+        """Arbitrage opportunities for each symbol, sorted by spread descending"""
+        exchange_names = list(data.exchange_index)
+        kernel = (
+            _specialized_pair_kernel(len(exchange_names))
+            if self._specialize_kernels else None
+        )
+        
+        results: Dict[str, List[ArbitrageOpportunity]] = {}
+        for requested in symbols:
+            symbol = _intern(requested)
+            col = data.symbol_index.get(symbol)
+            if col is None:
+                results[requested] = []
+                continue
+            
+            # Rates quoted for this symbol, one column of the matrix
+            column = data.rates_matrix[:, col]
+            if kernel is not None:
+                results[requested] = self._pair_opportunities(
+                    symbol, exchange_names, column, min_spread, top_k, kernel
+                )
+                continue
+            
+            rows = np.nonzero(column != MISSING_RATE)[0]
+            exchanges = [exchange_names[row] for row in rows.tolist()]
+            results[requested] = self._pair_opportunities(
+                symbol, exchanges, column[rows], min_spread, top_k
+            )
+        
+        return results
+    
+    def _pair_buffers(self, n_exchanges: int):
+        """Pair kernel outputs with room for every pair of n_exchanges"""
+        size = n_exchanges * (n_exchanges - 1) // 2
+        local = self._pair_local
+        if getattr(local, 'spread', None) is None or local.spread.shape[0] < size:
+            local.i = np.empty(size, dtype=np.int32)
+            local.j = np.empty(size, dtype=np.int32)
+            local.spread = np.empty(size, dtype=np.float64)
+        return local.i, local.j, local.spread
+    
+    def _pair_opportunities(
+        self,
+        symbol: str,
+        exchanges: List[str],
+        arr: np.ndarray,
+        min_spread: float,
+        top_k: Optional[int] = None,
+        kernel: Any = _enum_pairs
+    ) -> List[ArbitrageOpportunity]:
+        """Build opportunities for every pair of exchanges quoting a symbol"""
+        opportunities = []
+        
+        if len(arr) < 2:
+            return opportunities
+        
+        # Pairs passing the threshold, sorted by spread descending. The buffers
+        # are reused by this thread's next call, so read them before returning.
+        pair_i, pair_j, pair_spread = self._pair_buffers(len(arr))
+        count = kernel(arr, min_spread, pair_i, pair_j, pair_spread)
+        order = _descending_order(pair_spread[:count], top_k)
+        
+        rates = arr.tolist()
+        for i, j, spread in zip(
+            pair_i[order].tolist(), pair_j[order].tolist(), pair_spread[order].tolist()
+        ):
+            if rates[i] < rates[j]:
+                long_idx, short_idx = i, j
+            else:
+                long_idx, short_idx = j, i
+            opportunities.append(ArbitrageOpportunity(
+                symbol,
+                exchanges[long_idx],
+                exchanges[short_idx],
+                rates[long_idx] / 10000.0,
+                rates[short_idx] / 10000.0,
+                spread
+            ))
+        
+        return opportunities
+
+
+class onlyfundingClient(_ClientBase):
+    """
+    Client for accessing onlyfunding.fun funding rates API
+    
+    A client may be shared between threads. Scratch buffers are kept per thread,
+    and the cache is replaced atomically, though threads that miss the cache at
+    the same moment may each fetch the payload.
+    """
     
-    def __init__(self, base_url: Optional[str] = None, timeout: int = 30):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: int = 30,
+        cache_ttl: float = 30.0,
+        specialize_kernels: bool = False
+    ):
         """
         Initialize the onlyfunding client
         
         Args:
             base_url: Optional custom base URL (default: https://api.onlyfunding.fun)
             timeout: Request timeout in seconds (default: 30)
+            cache_ttl: Seconds to reuse fetched funding rates (default: 30, 0 disables)
+            specialize_kernels: Compile arbitrage kernels unrolled for the payload's
+                exchange count (numba only). Each process pays a one-off compile of
+                up to a few seconds, so this suits long-running scanners (default: False)
         """
-        self.base_url = base_url or self.BASE_URL
-        self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Accept': 'application/json',
-            'User-Agent': 'onlyfunding-Python-SDK/1.0.0'
-        })
+        super().__init__(base_url, timeout, cache_ttl, specialize_kernels)
+        self.session = httpx.Client(
+            http2=True,
+            timeout=timeout,
+            base_url=self.base_url,
+            headers=self.HEADERS
+        )
+        self._single_rate_streamed = False
+    
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool"""
+        self.session.close()
+    
+    def __enter__(self) -> "onlyfundingClient":
+        return self
     
-    def get_funding_rates(self) -> FundingRatesData:
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def clear_cache(self) -> None:
+        """Drop cached funding rates so the next call hits the API"""
+        super().clear_cache()
+        self._single_rate_streamed = False
+    
+    def get_funding_rates(self, force_refresh: bool = False) -> FundingRatesData:
         """
         Get current funding rates from all exchanges
         
+        Responses are cached in memory for ``cache_ttl`` seconds. If refreshing an
+        expired cache fails, the last good data is returned instead; with
+        ``force_refresh`` (or before any successful fetch) the error is raised.
+        
+        Args:
+            force_refresh: Bypass the cache and fetch fresh data (default: False)
+        
         Returns:
             FundingRatesData: Funding rates data
             
         Raises:
-            onlyfundingError: If API request fails
+            onlyfundingError: If API request fails and no cached data can be served
         """
+        if not force_refresh and self._cache_is_fresh():
+            return self._cache
+        
         try:
-            response = self.session.get(
-                f"{self.base_url}/funding",
-                timeout=self.timeout
-            )
+            response = self.session.get("/funding")
             response.raise_for_status()
-            
-            data = response.json()
-            
-            return FundingRatesData(
-                symbols=data.get('symbols', []),
-                exchanges=data.get('exchanges', {}),
-                funding_rates=data.get('funding_rates', {}),
-                oi_rankings=data.get('oi_rankings', {}),
-                default_oi_rank=data.get('default_oi_rank', '500+'),
-                timestamp=data.get('timestamp', '')
-            )
-        except requests.exceptions.RequestException as e:
-            raise onlyfundingError(f"Failed to fetch funding rates: {str(e)}")
-        except (KeyError, ValueError) as e:
-            raise onlyfundingError(f"Invalid API response: {str(e)}")
+            result = self._parse_funding_rates(response.content)
+        except httpx.HTTPError as e:
+            error = onlyfundingError(f"Failed to fetch funding rates: {str(e)}")
+            return self._stale_or_raise(error, force_refresh)
+        except onlyfundingError as e:
+            return self._stale_or_raise(e, force_refresh)
+        
+        self._store_cache(result)
+        return result
     
     def get_rate(self, exchange: str, symbol: str) -> Optional[float]:
         """
         Get funding rate for a specific exchange and symbol
         
+        With ijson installed, the first lookup before any payload has been fetched
+        (or after ``clear_cache()``) streams just the requested rate. Every later
+        call goes through the cached full payload, so the TTL cache applies.
+        
         Args:
             exchange: Exchange name (e.g., 'binance_1_perp')
             symbol: Symbol name (e.g., 'BTC')
@@ -96,66 +628,230 @@ class onlyfundingClient:
         Returns:
             Optional[float]: Funding rate as percentage, or None if not found
         """
-        data = self.get_funding_rates()
+        if ijson is not None and self._cache is None and not self._single_rate_streamed:
+            self._single_rate_streamed = True
+            try:
+                rate = self._fetch_single_rate(exchange, symbol)
+            except (ijson.JSONError, TypeError, ValueError):
+                pass  # fall back to a full fetch and parse
+            else:
+                return rate / 10000.0 if rate is not None else None
+        
+        self.get_funding_rates()
+        return self._get_rate_cached(self._cache_generation, exchange, symbol)
+    
+    def _fetch_single_rate(self, exchange: str, symbol: str) -> Optional[int]:
+        """
+        Stream the funding payload and stop at the requested rate
+        
+        Only the bytes up to the target key are parsed; the cache is not updated.
         
-        if exchange in data.funding_rates:
-            if symbol in data.funding_rates[exchange]:
-                rate = data.funding_rates[exchange][symbol]
-                return rate / 10000.0
+        Raises:
+            onlyfundingError: If API request fails
+            ijson.JSONError: If the payload cannot be decoded
+            TypeError, ValueError: If the rate is not a number
+        """
+        events = ijson.sendable_list()
+        parser = ijson.kvitems_coro(events, f'funding_rates.{exchange}', use_float=True)
+        try:
+            with self.session.stream("GET", "/funding") as response:
+                response.raise_for_status()
+                for chunk in response.iter_bytes():
+                    parser.send(chunk)
+                    for key, value in events:
+                        if key == symbol:
+                            return int(value)
+                    del events[:]
+        except httpx.HTTPError as e:
+            raise onlyfundingError(f"Failed to fetch funding rates: {str(e)}")
         
+        parser.close()
+        for key, value in events:
+            if key == symbol:
+                return int(value)
         return None
     
     def find_arbitrage_opportunities(
         self, 
         symbol: str, 
-        min_spread: float = 0.0
-    ) -> List[Dict[str, Any]]:
+        min_spread: float = 0.0,
+        top_k: Optional[int] = None
+    ) -> List[ArbitrageOpportunity]:
         """
         Find arbitrage opportunities for a symbol
         
         Args:
             symbol: Symbol to analyze (e.g., 'BTC')
             min_spread: Minimum spread in percentage to consider (default: 0.0)
+            top_k: Only return the top_k widest spreads (default: all)
             
         Returns:
             List of opportunities with exchange pairs and spreads
         """
-        data = self.get_funding_rates()
-        opportunities = []
+        return self.find_arbitrage_opportunities_batch([symbol], min_spread, top_k)[symbol]
+    
+    def find_arbitrage_opportunities_batch(
+        self,
+        symbols: List[str],
+        min_spread: float = 0.0,
+        top_k: Optional[int] = None
+    ) -> Dict[str, List[ArbitrageOpportunity]]:
+        """
+        Find arbitrage opportunities for several symbols from a single fetch
+        
+        Args:
+            symbols: Symbols to analyze (e.g., ['BTC', 'ETH'])
+            min_spread: Minimum spread in percentage to consider (default: 0.0)
+            top_k: Only return the top_k widest spreads per symbol (default: all)
+            
+        Returns:
+            Mapping of symbol to its opportunities, sorted by spread descending
+        """
+        return self._opportunities_from(self.get_funding_rates(), symbols, min_spread, top_k)
+
+
+class onlyfundingAsyncClient(_ClientBase):
+    """
+    Asyncio client for accessing onlyfunding.fun funding rates API
+    
+    Safe for concurrent coroutines on one event loop; like ``httpx.AsyncClient``
+    it must not be shared across event loops or threads.
+    """
+    
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: int = 30,
+        cache_ttl: float = 30.0,
+        specialize_kernels: bool = False
+    ):
+        """
+        Initialize the async onlyfunding client
         
-        # Collect all rates for the symbol
-        rates = {}
-        for exchange, symbols in data.funding_rates.items():
-            if symbol in symbols:
-                rates[exchange] = symbols[symbol]
+        Concurrent calls share one HTTP/2 connection, and a cold cache is filled
+        by a single request even when many coroutines ask at once.
         
-        if len(rates) < 2:
-            return opportunities
+        Args:
+            base_url: Optional custom base URL (default: https://api.onlyfunding.fun)
+            timeout: Request timeout in seconds (default: 30)
+            cache_ttl: Seconds to reuse fetched funding rates (default: 30, 0 disables)
+            specialize_kernels: Compile arbitrage kernels unrolled for the payload's
+                exchange count (numba only). Each process pays a one-off compile of
+                up to a few seconds, so this suits long-running scanners (default: False)
+        """
+        super().__init__(base_url, timeout, cache_ttl, specialize_kernels)
+        self.session = httpx.AsyncClient(
+            http2=True,
+            timeout=timeout,
+            base_url=self.base_url,
+            headers=self.HEADERS
+        )
+        self._fetch_lock: Optional[asyncio.Lock] = None
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool"""
+        await self.session.aclose()
+    
+    async def __aenter__(self) -> "onlyfundingAsyncClient":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+    
+    async def get_funding_rates(self, force_refresh: bool = False) -> FundingRatesData:
+        """
+        Get current funding rates from all exchanges
         
-        # Find all pairs
-        exchanges = list(rates.keys())
-        for i, exchange1 in enumerate(exchanges):
-            for exchange2 in exchanges[i+1:]:
-                rate1 = rates[exchange1]
-                rate2 = rates[exchange2]
-                spread = abs(rate1 - rate2) / 10000.0
-                
-                if spread >= min_spread:
-                    opportunities.append({
-                        'symbol': symbol,
-                        'exchange1': exchange1,
-                        'rate1': rate1 / 10000.0,
-                        'exchange2': exchange2,
-                        'rate2': rate2 / 10000.0,
-                        'spread': spread,
-                        'long_exchange': exchange1 if rate1 < rate2 else exchange2,
-                        'short_exchange': exchange2 if rate1 < rate2 else exchange1
-                    })
-        
-        # Sort by spread descending
-        opportunities.sort(key=lambda x: x['spread'], reverse=True)
+        Responses are cached in memory for ``cache_ttl`` seconds. If refreshing an
+        expired cache fails, the last good data is returned instead; with
+        ``force_refresh`` (or before any successful fetch) the error is raised.
         
-        return opportunities
+        Args:
+            force_refresh: Bypass the cache and fetch fresh data (default: False)
+        
+        Returns:
+            FundingRatesData: Funding rates data
+            
+        Raises:
+            onlyfundingError: If API request fails and no cached data can be served
+        """
+        if not force_refresh and self._cache_is_fresh():
+            return self._cache
+        
+        if self._fetch_lock is None:
+            self._fetch_lock = asyncio.Lock()
+        
+        async with self._fetch_lock:
+            # Another coroutine may have refreshed while we waited
+            if not force_refresh and self._cache_is_fresh():
+                return self._cache
+            
+            try:
+                response = await self.session.get("/funding")
+                response.raise_for_status()
+                result = self._parse_funding_rates(response.content)
+            except httpx.HTTPError as e:
+                error = onlyfundingError(f"Failed to fetch funding rates: {str(e)}")
+                return self._stale_or_raise(error, force_refresh)
+            except onlyfundingError as e:
+                return self._stale_or_raise(e, force_refresh)
+            
+            self._store_cache(result)
+            return result
+    
+    async def get_rate(self, exchange: str, symbol: str) -> Optional[float]:
+        """
+        Get funding rate for a specific exchange and symbol
+        
+        Args:
+            exchange: Exchange name (e.g., 'binance_1_perp')
+            symbol: Symbol name (e.g., 'BTC')
+            
+        Returns:
+            Optional[float]: Funding rate as percentage, or None if not found
+        """
+        await self.get_funding_rates()
+        return self._get_rate_cached(self._cache_generation, exchange, symbol)
+    
+    async def find_arbitrage_opportunities(
+        self,
+        symbol: str,
+        min_spread: float = 0.0,
+        top_k: Optional[int] = None
+    ) -> List[ArbitrageOpportunity]:
+        """
+        Find arbitrage opportunities for a symbol
+        
+        Args:
+            symbol: Symbol to analyze (e.g., 'BTC')
+            min_spread: Minimum spread in percentage to consider (default: 0.0)
+            top_k: Only return the top_k widest spreads (default: all)
+            
+        Returns:
+            List of opportunities with exchange pairs and spreads
+        """
+        results = await self.find_arbitrage_opportunities_batch([symbol], min_spread, top_k)
+        return results[symbol]
+    
+    async def find_arbitrage_opportunities_batch(
+        self,
+        symbols: List[str],
+        min_spread: float = 0.0,
+        top_k: Optional[int] = None
+    ) -> Dict[str, List[ArbitrageOpportunity]]:
+        """
+        Find arbitrage opportunities for several symbols from a single fetch
+        
+        Args:
+            symbols: Symbols to analyze (e.g., ['BTC', 'ETH'])
+            min_spread: Minimum spread in percentage to consider (default: 0.0)
+            top_k: Only return the top_k widest spreads per symbol (default: all)
+            
+        Returns:
+            Mapping of symbol to its opportunities, sorted by spread descending
+        """
+        data = await self.get_funding_rates()
+        return self._opportunities_from(data, symbols, min_spread, top_k)
 
 
 # Example usage
@@ -172,10 +868,10 @@ if __name__ == "__main__":
         print(f"BTC funding rate on Binance: {btc_rate:.4f}%")
     
     # Find arbitrage opportunities
-    opportunities = client.find_arbitrage_opportunities('BTC', min_spread=0.01)
-    print(f"\nFound {len(opportunities)} arbitrage opportunities for BTC:")
-    for opp in opportunities[:5]:  # Show top 5
-        print(f"  {opp['symbol']}: {opp['spread']:.4f}% spread")
-        print(f"    Long: {opp['long_exchange']} ({opp['rate1']:.4f}%)")
-        print(f"    Short: {opp['short_exchange']} ({opp['rate2']:.4f}%)")
+    opportunities = client.find_arbitrage_opportunities('BTC', min_spread=0.01, top_k=5)
+    print(f"\nTop {len(opportunities)} arbitrage opportunities for BTC:")
+    for opp in opportunities:
+        print(f"  {opp.symbol}: {opp.spread:.4f}% spread")
+        print(f"    Long: {opp.long_exchange} ({opp.rate_long:.4f}%)")
+        print(f"    Short: {opp.short_exchange} ({opp.rate_short:.4f}%)")
 
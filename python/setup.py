@@ -26,7 +26,13 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "requests>=2.28.0",
+        "numpy>=1.20.0",
+        "orjson>=3.6.0",
+        "httpx[http2,brotli]>=0.24.0",
     ],
+    extras_require={
+        "numba": ["numba>=0.56.0"],
+        "streaming": ["ijson>=3.1.0"],
+    },
 )
 